@@ -9,16 +9,20 @@ import json
 import time
 import asyncio
 import secrets
-from datetime import datetime
+import tempfile
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException, status, Request, Response, Body, BackgroundTasks
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import ORJSONResponse, HTMLResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
-import requests
+import httpx
+import orjson
 from dotenv import load_dotenv
 
 # Import our modules
@@ -28,11 +32,49 @@ import models
 # Load environment variables
 load_dotenv()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize application on startup and release resources on shutdown."""
+    print("\n" + "="*60)
+    print("🚀 Starting TunnelHub")
+    print("="*60)
+
+    # Ensure RSA keys exist (key generation is CPU-bound, so keep it off the event loop)
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, security.ensure_keys_exist, RSA_KEY_SIZE)
+
+    # Print configuration
+    print(f"📊 Configuration:")
+    print(f"   - Users: {len(USERS_CONFIG)}")
+    print(f"   - Auto-refresh: {AUTO_REFRESH_INTERVAL}s")
+    print(f"   - Rate limit: {RATE_LIMIT_RPM} RPM")
+    print(f"   - RSA key size: {RSA_KEY_SIZE}-bit")
+    print(f"   - Max request size: {MAX_REQUEST_SIZE / 1024 / 1024:.1f}MB")
+    print(f"   - Ngrok cache TTL: {NGROK_CACHE_TTL}s")
+    print(f"   - Ngrok concurrency: {NGROK_MAX_CONCURRENCY}")
+    print("="*60 + "\n")
+
+    yield
+
+    # The HTTP client is created on first use, so it may not exist
+    http_client = getattr(app.state, "http_client", None)
+    if http_client is not None:
+        await http_client.aclose()
+
+    # Drop per-loop state so a later startup in the same process (e.g. mangum on
+    # AWS Lambda runs startup/shutdown per invocation) recreates it on first use
+    app.state.http_client = None
+    app.state.ngrok_semaphore = None
+    ngrok_cache.clear()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="TunnelHub",
     description="Secure ngrok tunnel management dashboard",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configuration
@@ -41,6 +83,13 @@ RSA_KEY_SIZE = int(os.getenv("RSA_KEY_SIZE", "2048"))
 AUTO_REFRESH_INTERVAL = int(os.getenv("AUTO_REFRESH_INTERVAL", "5"))
 RATE_LIMIT_RPM = int(os.getenv("RATE_LIMIT_RPM", "120"))
 MAX_REQUEST_SIZE = int(os.getenv("MAX_REQUEST_SIZE", str(5 * 1024 * 1024)))
+NGROK_CACHE_TTL = float(os.getenv("NGROK_CACHE_TTL", "2"))
+NGROK_MAX_CONCURRENCY = int(os.getenv("NGROK_MAX_CONCURRENCY", "8"))
+WORKERS = int(os.getenv("WORKERS", "1"))
+RATE_LIMIT_MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "100000"))
+SESSION_TTL = int(os.getenv("SESSION_TTL", str(24 * 60 * 60)))
+CUSTOM_NAMES_MAX = int(os.getenv("CUSTOM_NAMES_MAX", "10000"))
+CUSTOM_NAMES_FILE = Path(os.getenv("CUSTOM_NAMES_FILE", str(Path(__file__).parent / "custom_names.json")))
 
 # Parse users from environment
 try:
@@ -56,107 +105,193 @@ except Exception as e:
 USERS_MAP: Dict[str, models.UserConfig] = {user.id: user for user in USERS_CONFIG}
 
 # In-memory session storage
-sessions: Dict[str, models.SessionData] = {}
+sessions: Dict[str, models.SessionEntry] = {}
+
+# Custom names storage (tunnel_id -> custom_name), least recently used first
+custom_names: "OrderedDict[str, str]" = OrderedDict()
 
-# In-memory custom names storage (tunnel_id -> custom_name)
-custom_names: Dict[str, str] = {}
+# Load persisted custom names
+try:
+    if CUSTOM_NAMES_FILE.exists():
+        with open(CUSTOM_NAMES_FILE, "r", encoding="utf-8") as f:
+            saved_names = json.load(f)
+        if not isinstance(saved_names, dict):
+            raise ValueError("expected a JSON object of tunnel_id -> custom_name")
+        custom_names.update(
+            (tunnel_id, custom_name) for tunnel_id, custom_name in saved_names.items()
+            if isinstance(custom_name, str)
+        )
+        # Keep only the most recently used names if the limit was lowered
+        while len(custom_names) > CUSTOM_NAMES_MAX:
+            custom_names.popitem(last=False)
+except Exception as e:
+    print(f"⚠️ Warning: Failed to load custom names from {CUSTOM_NAMES_FILE}: {e}")
+
+# Short-lived ngrok response cache ((token, api_url) -> (expires_at, fetch task)),
+# expires_at is set when the fetch completes
+ngrok_cache: Dict[tuple, tuple] = {}
+
+# Prebuilt ngrok API request headers (token -> headers)
+ngrok_headers: Dict[str, Dict[str, str]] = {}
 
 # Server start time
 SERVER_START_TIME = time.time()
 
-# Mount static files and templates
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+# Last formatted timestamp (epoch second, ISO 8601 string)
+_timestamp_cache = (0, "")
 
 
-# Ensure RSA keys exist on startup
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application on startup."""
-    print("\n" + "="*60)
-    print("🚀 Starting TunnelHub")
-    print("="*60)
+def utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string, formatted at most once per second."""
+    global _timestamp_cache
 
-    # Ensure RSA keys exist
-    security.ensure_keys_exist(RSA_KEY_SIZE)
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return _timestamp_cache[1]
 
-    # Print configuration
-    print(f"📊 Configuration:")
-    print(f"   - Users: {len(USERS_CONFIG)}")
-    print(f"   - Auto-refresh: {AUTO_REFRESH_INTERVAL}s")
-    print(f"   - Rate limit: {RATE_LIMIT_RPM} RPM")
-    print(f"   - RSA key size: {RSA_KEY_SIZE}-bit")
-    print(f"   - Max request size: {MAX_REQUEST_SIZE / 1024 / 1024:.1f}MB")
-    print("="*60 + "\n")
+# Mount static files and templates
+app.mount("/static", StaticFiles(directory="static"), name="static")
+templates = Jinja2Templates(directory="templates")
 
 
 # =============================================================================
 # Middleware
 # =============================================================================
 
-@app.middleware("http")
-async def dos_protection(request: Request, call_next):
-    """DoS protection middleware with rate limiting."""
-    # Skip rate limiting for public endpoints
-    if request.url.path in ["/", "/api/public-key", "/favicon.ico", "/docs", "/openapi.json"]:
-        response = await call_next(request)
-        return response
-
-    # Initialize rate limiter
-    if not hasattr(dos_protection, "_store"):
-        dos_protection._store = {}
-        dos_protection._lock = asyncio.Lock()
-
-    client = request.client.host if request.client else "unknown"
-    now = time.time()
-    refill_per_sec = RATE_LIMIT_RPM / 60.0
-
-    async with dos_protection._lock:
-        entry = dos_protection._store.get(client)
-        if not entry:
-            entry = {"tokens": float(RATE_LIMIT_RPM), "last": now}
-            dos_protection._store[client] = entry
-
-        # Refill tokens
-        elapsed = now - entry["last"]
-        if elapsed > 0:
-            entry["tokens"] = min(float(RATE_LIMIT_RPM), entry["tokens"] + elapsed * refill_per_sec)
-            entry["last"] = now
-
-        if entry["tokens"] < 1.0:
-            retry_after = int(max(1, (1.0 - entry["tokens"]) / refill_per_sec))
-            return JSONResponse(
+# Endpoints exempt from rate limiting
+PUBLIC_PATHS = frozenset({"/", "/api/public-key", "/favicon.ico", "/docs", "/openapi.json"})
+
+
+# Cost of one request in rate-limit token units (1/60000 of a token per unit)
+REQUEST_COST = 60000
+
+
+class DosProtectionMiddleware:
+    """DoS protection middleware with rate limiting (pure ASGI)."""
+
+    def __init__(self, app):
+        self.app = app
+        # Least recently seen clients are evicted once RATE_LIMIT_MAX_CLIENTS is reached
+        self._store: "OrderedDict[str, int]" = OrderedDict()
+
+    def _save(self, client: str, state: int) -> None:
+        """Store a client's bucket state and evict the least recently seen client."""
+        self._store[client] = state
+        self._store.move_to_end(client)
+        if len(self._store) > RATE_LIMIT_MAX_CLIENTS:
+            self._store.popitem(last=False)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Skip rate limiting for public endpoints
+        if scope["path"] in PUBLIC_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope["client"][0] if scope.get("client") else "unknown"
+        now_ms = int(time.monotonic() * 1000) & 0xFFFFFFFF
+        # Tokens are counted in 1/60000 units, so a millisecond refills exactly RATE_LIMIT_RPM
+        # units with no rounding, and one request costs REQUEST_COST
+        capacity = RATE_LIMIT_RPM * REQUEST_COST
+
+        # Bucket state is one int per client: (token_units << 32) | last_ms.
+        # Nothing below awaits, so the read-modify-write cannot interleave with
+        # another request and needs no lock.
+        state = self._store.get(client)
+        if state is None:
+            tokens = capacity
+        else:
+            tokens, last_ms = state >> 32, state & 0xFFFFFFFF
+            # Refill tokens (masked subtraction handles 32-bit wraparound)
+            elapsed_ms = (now_ms - last_ms) & 0xFFFFFFFF
+            tokens = min(capacity, tokens + elapsed_ms * RATE_LIMIT_RPM)
+
+        if tokens < REQUEST_COST:
+            self._save(client, (tokens << 32) | now_ms)
+            # Seconds until one request's worth has refilled, rounded up
+            retry_after = max(1, -(-(REQUEST_COST - tokens) // (RATE_LIMIT_RPM * 1000)))
+            response = ORJSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={"detail": "Too many requests. Please slow down."},
                 headers={"Retry-After": str(retry_after)}
             )
+            await response(scope, receive, send)
+            return
 
-        entry["tokens"] -= 1.0
+        self._save(client, ((tokens - REQUEST_COST) << 32) | now_ms)
 
-    # Check request size
-    content_length = request.headers.get("content-length")
-    if content_length:
-        try:
-            if int(content_length) > MAX_REQUEST_SIZE:
-                return JSONResponse(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    content={"detail": "Request body too large"}
-                )
-        except ValueError:
-            pass
+        # Check request size
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                try:
+                    if int(value) > MAX_REQUEST_SIZE:
+                        response = ORJSONResponse(
+                            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            content={"detail": "Request body too large"}
+                        )
+                        await response(scope, receive, send)
+                        return
+                except ValueError:
+                    pass
+                break
+
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(DosProtectionMiddleware)
 
-    response = await call_next(request)
-    return response
+# Streaming endpoints are not compressed, since gzip would buffer their chunks
+UNCOMPRESSED_PATHS = frozenset({"/api/tunnels/stream"})
 
 
-async def verify_session(request: Request) -> Optional[models.SessionData]:
+class StreamingAwareGZipMiddleware(GZipMiddleware):
+    """GZip middleware that passes streaming endpoints through uncompressed."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in UNCOMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress larger responses such as the tunnel list
+app.add_middleware(StreamingAwareGZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+def prune_sessions() -> None:
+    """Remove expired sessions."""
+    now = time.monotonic()
+    for token in [token for token, session in sessions.items() if now >= session.expires_at]:
+        del sessions[token]
+
+
+BEARER_PREFIX = "Bearer "
+BEARER_PREFIX_LEN = len(BEARER_PREFIX)
+
+
+async def verify_session(request: Request) -> Optional[models.SessionEntry]:
     """Verify session token from request headers."""
+    # Nobody is logged in, so skip header parsing entirely
+    if not sessions:
+        return None
+
     auth_header = request.headers.get("Authorization")
-    if not auth_header or not auth_header.startswith("Bearer "):
+    if not auth_header or auth_header[:BEARER_PREFIX_LEN] != BEARER_PREFIX:
         return None
 
-    session_token = auth_header[7:]  # Remove "Bearer " prefix
-    return sessions.get(session_token)
+    session_token = auth_header[BEARER_PREFIX_LEN:]  # Remove "Bearer " prefix
+    session = sessions.get(session_token)
+    if not session:
+        return None
+
+    if time.monotonic() >= session.expires_at:
+        sessions.pop(session_token, None)
+        return None
+    return session
 
 
 def require_session():
@@ -213,12 +348,14 @@ async def verify_login(request_data: models.LoginRequest):
         if security.verify_password(password, ADMIN_PASSWORD):
             # Create session
             session_token = security.generate_session_token()
-            session_data = models.SessionData(
+            prune_sessions()
+            sessions[session_token] = models.SessionEntry(
                 session_token=session_token,
+                user_id=None,
                 is_admin=True,
-                created_at=datetime.now().isoformat()
+                created_at=utc_timestamp(),
+                expires_at=time.monotonic() + SESSION_TTL
             )
-            sessions[session_token] = session_data
 
             return models.LoginResponse(
                 success=True,
@@ -247,7 +384,7 @@ async def logout(request: Request):
     """
     session = await verify_session(request)
     if session:
-        del sessions[session.session_token]
+        sessions.pop(session.session_token, None)
 
     return {"success": True, "message": "Logged out successfully"}
 
@@ -256,9 +393,36 @@ async def logout(request: Request):
 # API Endpoints - Tunnel Management
 # =============================================================================
 
-async def fetch_ngrok_tunnels(token: str, api_url: str = "https://api.ngrok.com") -> List[Dict[str, Any]]:
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client for ngrok API calls.
+
+    Created on first use rather than at startup, since serverless runtimes
+    may not send lifespan events.
+    """
+    http_client = getattr(app.state, "http_client", None)
+    if http_client is None:
+        # HTTP/2 multiplexes requests over kept-alive connections
+        http_client = app.state.http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=30)
+        )
+    return http_client
+
+
+def get_ngrok_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent ngrok API requests."""
+    # Created on first use so it binds to the running event loop (required on Python 3.8/3.9)
+    semaphore = getattr(app.state, "ngrok_semaphore", None)
+    if semaphore is None:
+        semaphore = app.state.ngrok_semaphore = asyncio.Semaphore(NGROK_MAX_CONCURRENCY)
+    return semaphore
+
+
+async def request_ngrok_tunnels(token: str, api_url: str = "https://api.ngrok.com") -> List[Dict[str, Any]]:
     """
-    Fetch tunnels from ngrok API for a specific token.
+    Request tunnels from ngrok API for a specific token.
 
     Args:
         token: Ngrok API token
@@ -267,25 +431,107 @@ async def fetch_ngrok_tunnels(token: str, api_url: str = "https://api.ngrok.com"
     Returns:
         List of tunnel data from ngrok API
     """
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Ngrok-Version": "2",
-        "Content-Type": "application/json"
-    }
+    headers = ngrok_headers.get(token)
+    if headers is None:
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Ngrok-Version": "2",
+            "Content-Type": "application/json"
+        }
+        ngrok_headers[token] = headers
+
+    # Set up outside the try block so setup errors are not reported as ngrok errors
+    http_client = get_http_client()
+    semaphore = get_ngrok_semaphore()
 
     try:
-        response = requests.get(f"{api_url}/tunnels", headers=headers, timeout=10)
+        async with semaphore:
+            response = await http_client.get(f"{api_url}/tunnels", headers=headers)
         if response.status_code == 200:
             data = response.json()
             return data.get("tunnels", [])
         else:
             print(f"⚠️ Ngrok API error: {response.status_code} - {response.text}")
             return []
-    except Exception as e:
+    except (httpx.HTTPError, ValueError) as e:
         print(f"⚠️ Failed to fetch tunnels: {e}")
         return []
 
 
+async def fetch_ngrok_tunnels(token: str, api_url: str = "https://api.ngrok.com") -> List[Dict[str, Any]]:
+    """
+    Fetch tunnels for a specific token, sharing recent and in-flight requests.
+
+    In-flight requests are shared, and responses are cached for NGROK_CACHE_TTL
+    seconds after they complete, so concurrent dashboard refreshes result in a
+    single ngrok API call per token.
+
+    Args:
+        token: Ngrok API token
+        api_url: Ngrok API URL
+
+    Returns:
+        List of tunnel data from ngrok API
+    """
+    key = (token, api_url)
+
+    # Reuse the fetch while it is in flight, and for NGROK_CACHE_TTL seconds after it completes
+    cached = ngrok_cache.get(key)
+    if cached and (not cached[1].done() or time.monotonic() < cached[0]):
+        task = cached[1]
+    else:
+        task = asyncio.ensure_future(request_ngrok_tunnels(token, api_url))
+        ngrok_cache[key] = (0.0, task)
+
+        def start_ttl(done_task: asyncio.Future) -> None:
+            # Only update the entry if it still holds this task
+            if ngrok_cache.get(key, (None, None))[1] is done_task:
+                ngrok_cache[key] = (time.monotonic() + NGROK_CACHE_TTL, done_task)
+
+        task.add_done_callback(start_ttl)
+
+    # Shield the shared task so one cancelled caller does not cancel it for the others
+    return await asyncio.shield(task)
+
+
+async def fetch_user_tunnels(user: models.UserConfig, token: str, api_url: str) -> tuple:
+    """Fetch tunnels for one of a user's tokens, returning (user, tunnels)."""
+    try:
+        return user, await fetch_ngrok_tunnels(token, api_url)
+    except Exception as e:
+        print(f"⚠️ Failed to fetch tunnels for {user.id}: {e}")
+        return user, []
+
+
+def user_tunnel_fetches(users: List[models.UserConfig]) -> list:
+    """Build one fetch coroutine per configured ngrok token of the given users."""
+    fetches = []
+    for user in users:
+        for token_idx, token in enumerate(user.ngrok_tokens):
+            api_url = user.ngrok_api_urls[min(token_idx, len(user.ngrok_api_urls) - 1)]
+            fetches.append(fetch_user_tunnels(user, token, api_url))
+    return fetches
+
+
+def build_tunnel(user: models.UserConfig, tunnel_data: Dict[str, Any]) -> models.Tunnel:
+    """Create a tunnel model from ngrok API data (trusted, so validation is skipped)."""
+    tunnel_id = tunnel_data.get("id", "")
+    return models.Tunnel.model_construct(
+        id=tunnel_id,
+        public_url=tunnel_data.get("public_url", ""),
+        proto=tunnel_data.get("proto", ""),
+        region=tunnel_data.get("region", ""),
+        tunnel_session_id=tunnel_data.get("tunnel_session_id", ""),
+        forwards_to=tunnel_data.get("forwards_to"),
+        created_at=tunnel_data.get("created_at"),
+        metadata=tunnel_data.get("metadata", {}),
+        user_id=user.id,
+        user_name=user.name,
+        custom_name=get_custom_name(tunnel_id),
+        status=models.TunnelStatus.ONLINE
+    )
+
+
 @app.get("/api/tunnels", response_model=models.TunnelListResponse)
 async def get_tunnels(
     request: Request,
@@ -309,42 +555,121 @@ async def get_tunnels(
     # Fetch tunnels for each user (or specific user if filtered)
     users_to_fetch = [USERS_MAP[user_id]] if user_id and user_id in USERS_MAP else USERS_CONFIG
 
-    for user in users_to_fetch:
-        for token_idx, token in enumerate(user.ngrok_tokens):
-            api_url = user.ngrok_api_urls[min(token_idx, len(user.ngrok_api_urls) - 1)]
+    # Fetch tunnels from ngrok API for every token concurrently
+    results = await asyncio.gather(*user_tunnel_fetches(users_to_fetch))
 
-            # Fetch tunnels from ngrok API
-            ngrok_tunnels = await fetch_ngrok_tunnels(token, api_url)
+    for user, ngrok_tunnels in results:
+        all_tunnels.extend(build_tunnel(user, tunnel_data) for tunnel_data in ngrok_tunnels)
 
-            # Process each tunnel
-            for tunnel_data in ngrok_tunnels:
-                tunnel_id = tunnel_data.get("id", "")
-
-                # Create tunnel model
-                tunnel = models.Tunnel(
-                    id=tunnel_id,
-                    public_url=tunnel_data.get("public_url", ""),
-                    proto=tunnel_data.get("proto", ""),
-                    region=tunnel_data.get("region", ""),
-                    tunnel_session_id=tunnel_data.get("tunnel_session_id", ""),
-                    forwards_to=tunnel_data.get("forwards_to"),
-                    created_at=tunnel_data.get("created_at"),
-                    metadata=tunnel_data.get("metadata", {}),
-                    user_id=user.id,
-                    user_name=user.name,
-                    custom_name=custom_names.get(tunnel_id),
-                    status=models.TunnelStatus.ONLINE
-                )
-
-                all_tunnels.append(tunnel)
-
-    return models.TunnelListResponse(
+    # Return the dumped model directly to skip FastAPI's response_model re-validation
+    response = models.TunnelListResponse(
         success=True,
         tunnels=all_tunnels,
         total_count=len(all_tunnels),
         filtered_user=user_id,
-        timestamp=datetime.now().isoformat()
+        timestamp=utc_timestamp()
     )
+    return ORJSONResponse(content=response.model_dump())
+
+
+@app.get("/api/tunnels/stream")
+async def stream_tunnels(
+    request: Request,
+    user_id: Optional[str] = None
+):
+    """
+    Stream tunnels as NDJSON with optional user filtering.
+
+    Each line is one tunnel object. Tunnels are sent as soon as the ngrok
+    API returns them for a token, so the slowest token does not hold back
+    the rest and the full list is never held in memory.
+
+    Args:
+        request: FastAPI request object
+        user_id: Optional user ID to filter tunnels
+
+    Returns:
+        Streaming NDJSON response of tunnels
+    """
+    users_to_fetch = [USERS_MAP[user_id]] if user_id and user_id in USERS_MAP else USERS_CONFIG
+
+    async def generate():
+        for fetch in asyncio.as_completed(user_tunnel_fetches(users_to_fetch)):
+            user, ngrok_tunnels = await fetch
+            for tunnel_data in ngrok_tunnels:
+                yield orjson.dumps(build_tunnel(user, tunnel_data).model_dump()) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def get_custom_name(tunnel_id: str) -> Optional[str]:
+    """Get the custom name for a tunnel, marking it as recently used."""
+    custom_name = custom_names.get(tunnel_id)
+    if custom_name is not None:
+        custom_names.move_to_end(tunnel_id)
+    return custom_name
+
+
+def write_custom_names(names: List[tuple]) -> None:
+    """Atomically write custom names to CUSTOM_NAMES_FILE (blocking, run in an executor)."""
+    # A unique temp file per write, so concurrent writers (e.g. several workers) cannot clobber each other
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=CUSTOM_NAMES_FILE.parent,
+            prefix=f"{CUSTOM_NAMES_FILE.name}.",
+            suffix=".tmp",
+            delete=False
+        ) as f:
+            tmp_path = f.name
+            json.dump(dict(names), f)
+        os.replace(tmp_path, CUSTOM_NAMES_FILE)
+    except (OSError, IOError) as e:
+        # Read-only filesystems (e.g. serverless) keep names in memory only
+        print(f"⚠️ Could not save custom names to {CUSTOM_NAMES_FILE}: {e}")
+        try:
+            os.unlink(tmp_path)
+        except (NameError, OSError):
+            pass
+
+
+# Custom names save state: a write is running / names changed since the last write
+custom_names_saving = False
+custom_names_dirty = False
+
+
+async def save_custom_names() -> None:
+    """
+    Persist custom names to disk without blocking the event loop.
+
+    Only one write runs at a time; changes made while it runs are picked up
+    by a single follow-up write, so the latest names always reach the file.
+    """
+    global custom_names_saving, custom_names_dirty
+
+    custom_names_dirty = True
+    if custom_names_saving:
+        return
+
+    custom_names_saving = True
+    try:
+        loop = asyncio.get_running_loop()
+        while custom_names_dirty:
+            custom_names_dirty = False
+            await loop.run_in_executor(None, write_custom_names, list(custom_names.items()))
+    finally:
+        custom_names_saving = False
+
+
+async def set_custom_name(tunnel_id: str, custom_name: str) -> None:
+    """Store a custom name, evicting the least recently used ones, and persist to disk."""
+    custom_names[tunnel_id] = custom_name
+    custom_names.move_to_end(tunnel_id)
+    while len(custom_names) > CUSTOM_NAMES_MAX:
+        custom_names.popitem(last=False)
+
+    await save_custom_names()
 
 
 @app.put("/api/tunnels/{tunnel_id}/name", response_model=models.CustomNameResponse)
@@ -373,7 +698,7 @@ async def set_tunnel_name(
         )
 
     # Store custom name
-    custom_names[tunnel_id] = request_data.custom_name
+    await set_custom_name(tunnel_id, request_data.custom_name)
 
     return models.CustomNameResponse(
         success=True,
@@ -507,6 +832,7 @@ async def api_root():
             },
             "tunnels": {
                 "GET /api/tunnels": "Get all tunnels (with optional user filter)",
+                "GET /api/tunnels/stream": "Stream tunnels as NDJSON (with optional user filter)",
                 "PUT /api/tunnels/{id}/name": "Set custom tunnel name"
             },
             "admin": {
@@ -534,9 +860,12 @@ if __name__ == "__main__":
     print(f"⚙️  Auto-refresh: {AUTO_REFRESH_INTERVAL}s")
     print("="*60 + "\n")
 
+    # uvloop is not available on Windows; fall back to the stock asyncio loop there
     uvicorn.run(
-        app,
+        "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=WORKERS
     )
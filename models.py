@@ -1,12 +1,24 @@
 """
-Pydantic models for request/response validation.
+Pydantic models for request/response validation, plus internal state records.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
+from dataclasses import dataclass
 from enum import Enum
 
 
+class AppModel(BaseModel):
+    """Base model with the shared Pydantic configuration."""
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        arbitrary_types_allowed=False,
+        str_strip_whitespace=False,
+        defer_build=False
+    )
+
+
 class TunnelStatus(str, Enum):
     """Tunnel status enumeration."""
     ONLINE = "online"
@@ -14,7 +26,7 @@ class TunnelStatus(str, Enum):
     PENDING = "pending"
 
 
-class UserConfig(BaseModel):
+class UserConfig(AppModel):
     """User configuration model."""
     id: str = Field(..., description="Unique user identifier (e.g., user_1)")
     name: str = Field(..., description="Display name for the user")
@@ -22,7 +34,7 @@ class UserConfig(BaseModel):
     ngrok_api_urls: List[str] = Field(default=["https://api.ngrok.com"], description="Ngrok API URLs")
 
 
-class NgrokTunnel(BaseModel):
+class NgrokTunnel(AppModel):
     """Ngrok tunnel model."""
     id: str = Field(..., description="Tunnel ID from ngrok")
     public_url: str = Field(..., description="Public URL of the tunnel")
@@ -42,7 +54,7 @@ class Tunnel(NgrokTunnel):
     status: TunnelStatus = Field(default=TunnelStatus.ONLINE, description="Tunnel status")
 
 
-class TunnelListResponse(BaseModel):
+class TunnelListResponse(AppModel):
     """Response model for tunnel list endpoint."""
     success: bool = Field(..., description="Request success status")
     tunnels: List[Tunnel] = Field(default_factory=list, description="List of tunnels")
@@ -51,24 +63,24 @@ class TunnelListResponse(BaseModel):
     timestamp: str = Field(..., description="Response timestamp")
 
 
-class LoginRequest(BaseModel):
+class LoginRequest(AppModel):
     """Login request model with encrypted password."""
     encrypted_password: str = Field(..., description="Base64-encoded RSA-encrypted password")
 
 
-class LoginResponse(BaseModel):
+class LoginResponse(AppModel):
     """Login response model."""
     success: bool = Field(..., description="Login success status")
     session_token: Optional[str] = Field(None, description="Session token for authenticated requests")
     message: str = Field(..., description="Response message")
 
 
-class CustomNameRequest(BaseModel):
+class CustomNameRequest(AppModel):
     """Request model for setting custom tunnel name."""
     custom_name: str = Field(..., min_length=1, max_length=100, description="Custom name for the tunnel")
 
 
-class CustomNameResponse(BaseModel):
+class CustomNameResponse(AppModel):
     """Response model for custom name update."""
     success: bool = Field(..., description="Update success status")
     message: str = Field(..., description="Response message")
@@ -76,14 +88,14 @@ class CustomNameResponse(BaseModel):
     custom_name: str = Field(..., description="Updated custom name")
 
 
-class UsersListResponse(BaseModel):
+class UsersListResponse(AppModel):
     """Response model for users list endpoint."""
     success: bool = Field(..., description="Request success status")
     users: List[UserConfig] = Field(default_factory=list, description="List of users")
     total_count: int = Field(..., description="Total number of users")
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(AppModel):
     """Health check response model."""
     status: str = Field(..., description="Server status")
     pid: int = Field(..., description="Process ID")
@@ -91,21 +103,32 @@ class HealthResponse(BaseModel):
     uptime_seconds: float = Field(..., description="Server uptime in seconds")
 
 
-class PublicKeyResponse(BaseModel):
+class PublicKeyResponse(AppModel):
     """Public key response model."""
     public_key: str = Field(..., description="RSA public key in PEM format")
     key_size: int = Field(..., description="RSA key size in bits")
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(AppModel):
     """Error response model."""
     detail: str = Field(..., description="Error details")
     status_code: int = Field(..., description="HTTP status code")
 
 
-class SessionData(BaseModel):
+class SessionData(AppModel):
     """Session data model."""
     session_token: str = Field(..., description="Session token")
     user_id: Optional[str] = Field(None, description="Associated user ID (if logged in as user)")
     is_admin: bool = Field(default=False, description="Admin session flag")
     created_at: str = Field(..., description="Session creation timestamp")
+
+
+@dataclass
+class SessionEntry:
+    """Internal session record kept in the sessions store (never serialized)."""
+    __slots__ = ("session_token", "user_id", "is_admin", "created_at", "expires_at")
+    session_token: str
+    user_id: Optional[str]
+    is_admin: bool
+    created_at: str
+    expires_at: float
@@ -25,6 +25,40 @@ _in_memory_private_key = None
 _in_memory_public_key_pem = None
 
 
+def _load_pem_private_key(pem_data: bytes):
+    """
+    Parse a PEM private key, making sure it carries CRT parameters.
+
+    Decryption with the CRT parameters (dP, dQ, qInv) is about 4x faster than
+    a plain modular exponentiation with d, so keys missing them are rebuilt.
+
+    Args:
+        pem_data: Private key in PEM format
+
+    Returns:
+        RSA private key object
+    """
+    private_key = serialization.load_pem_private_key(
+        pem_data,
+        password=None,
+        backend=default_backend()
+    )
+
+    numbers = private_key.private_numbers()
+    if numbers.dmp1 and numbers.dmq1 and numbers.iqmp:
+        return private_key
+
+    return rsa.RSAPrivateNumbers(
+        p=numbers.p,
+        q=numbers.q,
+        d=numbers.d,
+        dmp1=rsa.rsa_crt_dmp1(numbers.d, numbers.p),
+        dmq1=rsa.rsa_crt_dmq1(numbers.d, numbers.q),
+        iqmp=rsa.rsa_crt_iqmp(numbers.p, numbers.q),
+        public_numbers=numbers.public_numbers
+    ).private_key(default_backend())
+
+
 def generate_rsa_key_pair(key_size: int = 2048) -> tuple:
     """
     Generate RSA key pair and save to files (or store in memory for serverless).
@@ -74,6 +108,8 @@ def generate_rsa_key_pair(key_size: int = 2048) -> tuple:
             f.write(private_pem)
         with open(PUBLIC_KEY_PATH, 'wb') as f:
             f.write(public_pem)
+        # Keep the parsed key cached so load_private_key() matches the new files
+        _in_memory_private_key = private_key
         print(f"✅ RSA key pair generated and saved ({key_size}-bit)")
         print(f"   Private key: {PRIVATE_KEY_PATH}")
         print(f"   Public key: {PUBLIC_KEY_PATH}")
@@ -119,6 +155,7 @@ def get_public_key_pem() -> str:
 def load_private_key():
     """
     Load the private key from memory, environment, or file.
+    The parsed key is cached in memory so the PEM is only parsed once.
 
     Returns:
         RSA private key object
@@ -128,29 +165,21 @@ def load_private_key():
     """
     global _in_memory_private_key
 
-    # Check in-memory storage first (serverless)
+    # Check in-memory storage first (serverless, or already parsed)
     if _in_memory_private_key:
         return _in_memory_private_key
 
     # Try to load from environment variable (for Vercel)
     env_private_key = os.environ.get('RSA_PRIVATE_KEY')
     if env_private_key:
-        private_key = serialization.load_pem_private_key(
-            env_private_key.encode('utf-8'),
-            password=None,
-            backend=default_backend()
-        )
-        return private_key
+        _in_memory_private_key = _load_pem_private_key(env_private_key.encode('utf-8'))
+        return _in_memory_private_key
 
     # Try to load from file (local development)
     if PRIVATE_KEY_PATH.exists():
         with open(PRIVATE_KEY_PATH, 'rb') as f:
-            private_key = serialization.load_pem_private_key(
-                f.read(),
-                password=None,
-                backend=default_backend()
-            )
-        return private_key
+            _in_memory_private_key = _load_pem_private_key(f.read())
+        return _in_memory_private_key
 
     raise FileNotFoundError("Private key not found. Please generate keys first or set RSA_PRIVATE_KEY environment variable.")
 
@@ -221,11 +250,7 @@ def ensure_keys_exist(key_size: int = 2048) -> None:
         # Load them into memory for faster access
         try:
             env_private_key = os.environ.get('RSA_PRIVATE_KEY')
-            _in_memory_private_key = serialization.load_pem_private_key(
-                env_private_key.encode('utf-8'),
-                password=None,
-                backend=default_backend()
-            )
+            _in_memory_private_key = _load_pem_private_key(env_private_key.encode('utf-8'))
             _in_memory_public_key_pem = os.environ.get('RSA_PUBLIC_KEY')
         except Exception as e:
             print(f"⚠️ Failed to load keys from environment: {e}")
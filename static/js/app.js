@@ -210,23 +210,46 @@ async function apiRequest(url, options = {}) {
 
 /**
  * Fetch tunnels from server
+ * Tunnels are streamed as NDJSON; onProgress (if given) is called as each batch arrives
  */
-async function fetchTunnels(userFilter = null) {
+async function fetchTunnels(userFilter = null, onProgress = null) {
     try {
-        let url = '/api/tunnels';
+        let url = '/api/tunnels/stream';
         if (userFilter && userFilter !== 'all') {
             url += `?user_id=${encodeURIComponent(userFilter)}`;
         }
 
         const response = await apiRequest(url);
-        const data = await response.json();
-
-        if (data.success) {
-            state.tunnels = data.tunnels;
-            return data.tunnels;
-        } else {
+        if (!response.ok) {
             throw new Error('Failed to fetch tunnels');
         }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        const tunnels = [];
+        let buffered = '';
+
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+
+            buffered += decoder.decode(value, { stream: true });
+            const lines = buffered.split('\n');
+            buffered = lines.pop();
+            lines.filter(line => line.trim()).forEach(line => tunnels.push(JSON.parse(line)));
+
+            if (onProgress) {
+                state.tunnels = tunnels.slice();
+                onProgress();
+            }
+        }
+
+        if (buffered.trim()) {
+            tunnels.push(JSON.parse(buffered));
+        }
+
+        state.tunnels = tunnels;
+        return tunnels;
     } catch (error) {
         console.error('Error fetching tunnels:', error);
         throw error;
@@ -462,8 +485,8 @@ async function filterByUser(userId) {
         currentView.textContent = user ? `${user.name}'s Tunnels` : 'Tunnels';
     }
 
-    // Fetch and render filtered tunnels
-    await fetchTunnels(userId);
+    // Fetch and render filtered tunnels as they arrive
+    await fetchTunnels(userId, renderTunnels);
     renderTunnels();
 }
 
@@ -655,11 +678,12 @@ document.addEventListener('DOMContentLoaded', async () => {
             const success = await login(password);
 
             if (success) {
-                // Fetch data and show dashboard
+                // Show dashboard and render tunnels as they arrive
                 await fetchUsers();
-                await fetchTunnels();
                 showDashboard();
                 renderUsers();
+                await fetchTunnels(null, renderTunnels);
+                renderUsers();
                 renderTunnels();
                 startAutoRefresh();
                 showToast('Login successful!', 'success');